@@ -1,4 +1,5 @@
 import copy
+import functools
 import json
 import logging.handlers
 import math
@@ -12,7 +13,7 @@ import typing
 import unittest.mock
 import warnings
 from abc import abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ConfigSpace.configuration_space import Configuration, ConfigurationSpace
 
@@ -61,6 +62,24 @@ from autoPyTorch.utils.single_thread_client import SingleThreadedClient
 from autoPyTorch.utils.stopwatch import StopWatch
 
 
+# Resolved once at import time; the file location is fixed relative to the
+# package and does not depend on the estimator instance
+_DEFAULT_PIPELINE_OPTIONS_PATH = os.path.join(
+    os.path.dirname(__file__), '../configs/default_pipeline_options.json')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_default_pipeline_options(path: str) -> Dict[str, Any]:
+    """Reads and parses the default pipeline options from disk.
+
+    The parsed content is cached, as the file is shipped with the package
+    and immutable. This prevents repeated disk I/O + json parsing when
+    many estimator objects are created, for example by parallel workers.
+    """
+    with open(path) as f:
+        return replace_string_bool_to_bool(json.load(f))
+
+
 def _pipeline_predict(pipeline: BasePipeline,
                       X: Union[np.ndarray, pd.DataFrame],
                       batch_size: int,
@@ -172,8 +191,9 @@ class BaseTask:
         self.task_type = task_type or ""
         self._stopwatch = StopWatch()
 
-        self.pipeline_options = replace_string_bool_to_bool(json.load(open(
-            os.path.join(os.path.dirname(__file__), '../configs/default_pipeline_options.json'))))
+        # Copy the cached options, as they are updated per-estimator via
+        # set_pipeline_config()/_search()
+        self.pipeline_options = dict(_load_default_pipeline_options(_DEFAULT_PIPELINE_OPTIONS_PATH))
 
         self.search_space: Optional[ConfigurationSpace] = None
         self._dataset_requirements: Optional[List[FitRequirement]] = None
@@ -1115,17 +1135,19 @@ class BaseTask:
         dataset_properties = dataset.get_dataset_properties(dataset_requirements)
         self._backend.save_datamanager(dataset)
 
-        X: Dict[str, Any] = dict({'dataset_properties': dataset_properties,
-                                  'backend': self._backend,
-                                  'X_train': dataset.train_tensors[0],
-                                  'y_train': dataset.train_tensors[1],
-                                  'X_test': dataset.test_tensors[0] if dataset.test_tensors is not None else None,
-                                  'y_test': dataset.test_tensors[1] if dataset.test_tensors is not None else None,
-                                  'train_indices': dataset.splits[split_id][0],
-                                  'val_indices': dataset.splits[split_id][1],
-                                  'split_id': split_id,
-                                  'num_run': self._backend.get_next_num_run(),
-                                  })
+        # Build the fit dictionary in place; wrapping the literal in dict()
+        # would copy every key a second time
+        X: Dict[str, Any] = {'dataset_properties': dataset_properties,
+                             'backend': self._backend,
+                             'X_train': dataset.train_tensors[0],
+                             'y_train': dataset.train_tensors[1],
+                             'X_test': dataset.test_tensors[0] if dataset.test_tensors is not None else None,
+                             'y_test': dataset.test_tensors[1] if dataset.test_tensors is not None else None,
+                             'train_indices': dataset.splits[split_id][0],
+                             'val_indices': dataset.splits[split_id][1],
+                             'split_id': split_id,
+                             'num_run': self._backend.get_next_num_run(),
+                             }
         X.update(self.pipeline_options)
         if self.models_ is None or len(self.models_) == 0 or self.ensemble_ is None:
             self._load_models()
@@ -1194,18 +1216,19 @@ class BaseTask:
         if pipeline_config is not None:
             pipeline.set_hyperparameters(pipeline_config)
 
-        # initialise fit dictionary
-        X: Dict[str, Any] = dict({'dataset_properties': dataset_properties,
-                                  'backend': self._backend,
-                                  'X_train': dataset.train_tensors[0],
-                                  'y_train': dataset.train_tensors[1],
-                                  'X_test': dataset.test_tensors[0] if dataset.test_tensors is not None else None,
-                                  'y_test': dataset.test_tensors[1] if dataset.test_tensors is not None else None,
-                                  'train_indices': dataset.splits[split_id][0],
-                                  'val_indices': dataset.splits[split_id][1],
-                                  'split_id': split_id,
-                                  'num_run': self._backend.get_next_num_run(),
-                                  })
+        # initialise fit dictionary in place; wrapping the literal in dict()
+        # would copy every key a second time
+        X: Dict[str, Any] = {'dataset_properties': dataset_properties,
+                             'backend': self._backend,
+                             'X_train': dataset.train_tensors[0],
+                             'y_train': dataset.train_tensors[1],
+                             'X_test': dataset.test_tensors[0] if dataset.test_tensors is not None else None,
+                             'y_test': dataset.test_tensors[1] if dataset.test_tensors is not None else None,
+                             'train_indices': dataset.splits[split_id][0],
+                             'val_indices': dataset.splits[split_id][1],
+                             'split_id': split_id,
+                             'num_run': self._backend.get_next_num_run(),
+                             }
         X.update(self.pipeline_options)
 
         fit_and_suppress_warnings(self._logger, pipeline, X, y=None)
@@ -1265,6 +1288,55 @@ class BaseTask:
 
         return predictions
 
+    def predict_batch(
+        self,
+        X_batches: Iterable[np.ndarray],
+        batch_size: Optional[int] = None,
+        n_jobs: int = 1
+    ) -> Iterator[np.ndarray]:
+        """Generate the estimator predictions for a stream of test set chunks.
+
+        Contrary to calling predict() once per chunk, the logger and the
+        ensemble models are resolved a single time, so the per-call setup
+        cost is amortized across all chunks. This is useful when a large
+        test set has to be predicted in pieces to bound memory usage.
+
+        Args:
+        X_batches: (Iterable[np.ndarray])
+            Chunks of test set examples.
+        Returns:
+            Iterator over the predictions for each chunk.
+        """
+        if self._logger is None:
+            self._logger = self._get_logger("Predict-Logger")
+
+        if self.ensemble_ is None and not self._load_models():
+            raise ValueError("No ensemble found. Either fit has not yet "
+                             "been called or no ensemble was fitted")
+
+        # Mypy assert
+        assert self.ensemble_ is not None, "Load models should error out if no ensemble"
+
+        if isinstance(self.resampling_strategy, HoldoutValTypes):
+            models = self.models_
+        elif isinstance(self.resampling_strategy, CrossValTypes):
+            models = self.cv_models_
+
+        identifiers = self.ensemble_.get_selected_model_identifiers()
+        task = STRING_TO_TASK_TYPES[self.task_type]
+
+        try:
+            for X_test in X_batches:
+                all_predictions = joblib.Parallel(n_jobs=n_jobs)(
+                    joblib.delayed(_pipeline_predict)(
+                        models[identifier], X_test, batch_size, self._logger, task
+                    )
+                    for identifier in identifiers
+                )
+                yield self.ensemble_.predict(all_predictions)
+        finally:
+            self._clean_logger()
+
     def score(
         self,
         y_pred: np.ndarray,
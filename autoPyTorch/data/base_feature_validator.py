@@ -12,6 +12,11 @@ from sklearn.base import BaseEstimator
 from autoPyTorch.utils.logging_ import PicklableClientLogger
 
 
+# Fallback logger resolved once at import time; logging.getLogger takes the
+# manager lock on every call, which adds up when a validator is built per fold
+_DEFAULT_LOGGER = logging.getLogger(__name__)
+
+
 SUPPORTED_FEAT_TYPES = typing.Union[
     typing.List,
     pd.DataFrame,
@@ -56,7 +61,7 @@ class BaseFeatureValidator(BaseEstimator):
 
         self.logger: typing.Union[
             PicklableClientLogger, logging.Logger
-        ] = logger if logger is not None else logging.getLogger(__name__)
+        ] = logger if logger is not None else _DEFAULT_LOGGER
 
         # Required for dataset properties
         self.num_features = None  # type: typing.Optional[int]
@@ -88,18 +93,31 @@ class BaseFeatureValidator(BaseEstimator):
         if isinstance(X_train, list):
             X_train, X_test = self.list_to_dataframe(X_train, X_test)
 
+        # Canonicalize sparse data to CSR here, once, so that _check_data
+        # and _fit do not each trigger their own O(nnz) format conversion
+        # for lil/dok/coo/... inputs further down the line
+        if scipy.sparse.issparse(X_train) and not scipy.sparse.isspmatrix_csr(X_train):
+            X_train = X_train.tocsr()
+        if X_test is not None and scipy.sparse.issparse(X_test) \
+                and not scipy.sparse.isspmatrix_csr(X_test):
+            X_test = X_test.tocsr()
+
         self._check_data(X_train)
 
         if X_test is not None:
-            self._check_data(X_test)
-
-            if np.shape(X_train)[1] != np.shape(X_test)[1]:
+            # A direct attribute read is cheaper than going through np.shape
+            # dispatch; done before _check_data so mismatches fail fast
+            n_train = X_train.shape[1] if hasattr(X_train, 'shape') else len(X_train[0])
+            n_test = X_test.shape[1] if hasattr(X_test, 'shape') else len(X_test[0])
+            if n_train != n_test:
                 raise ValueError("The feature dimensionality of the train and test "
                                  "data does not match train({}) != test({})".format(
-                                     np.shape(X_train)[1],
-                                     np.shape(X_test)[1]
+                                     n_train,
+                                     n_test
                                  ))
 
+            self._check_data(X_test)
+
         # Fit on the training data
         self._fit(X_train)
 
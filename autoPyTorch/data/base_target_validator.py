@@ -12,6 +12,11 @@ from sklearn.base import BaseEstimator
 from autoPyTorch.utils.logging_ import PicklableClientLogger
 
 
+# Fallback logger resolved once at import time; logging.getLogger takes the
+# manager lock on every call, which adds up when a validator is built per fold
+_DEFAULT_LOGGER = logging.getLogger(__name__)
+
+
 SUPPORTED_TARGET_TYPES = typing.Union[
     typing.List,
     pd.Series,
@@ -57,7 +62,7 @@ class BaseTargetValidator(BaseEstimator):
 
         self.logger: typing.Union[
             PicklableClientLogger, logging.Logger
-        ] = logger if logger is not None else logging.getLogger(__name__)
+        ] = logger if logger is not None else _DEFAULT_LOGGER
 
         # Store the dtype for remapping to correct type
         self.dtype = None  # type: typing.Optional[type]
@@ -1,4 +1,3 @@
-import functools
 import typing
 
 import numpy as np
@@ -9,14 +8,46 @@ from pandas.api.types import is_numeric_dtype
 import scipy.sparse
 
 import sklearn.utils
-from sklearn import preprocessing
 from sklearn.base import BaseEstimator
-from sklearn.compose import ColumnTransformer
 from sklearn.exceptions import NotFittedError
 
 from autoPyTorch.data.base_feature_validator import BaseFeatureValidator, SUPPORTED_FEAT_TYPES
 
 
+# Concrete types accepted by _check_data. Kept as a module-level tuple so the
+# isinstance check does not rebuild it on every call; sparse inputs are
+# covered separately through the C-level scipy.sparse.issparse check
+_SUPPORTED_DENSE_TYPES = (np.ndarray, pd.DataFrame)
+
+
+def _has_object_columns(X: pd.DataFrame) -> bool:
+    """
+    Indicate whether a DataFrame has any column of object dtype
+
+    Scanning X.dtypes answers this without materializing the filtered
+    sub-frame that select_dtypes would allocate just to test emptiness
+    """
+    return bool((X.dtypes == object).any())
+
+
+def _list_to_typed_dataframe(data: typing.List) -> pd.DataFrame:
+    """
+    Converts a python list to a pandas DataFrame
+
+    Regular numeric lists are coerced through numpy in a single C-level
+    pass, which avoids pandas' per-row python-level type inference.
+    Mixed-type or ragged lists keep the original pandas parsing
+    """
+    try:
+        array = np.asarray(data)
+    except Exception:
+        # Ragged lists cannot be interpreted as an array
+        return pd.DataFrame(data=data).infer_objects()
+    if array.ndim <= 2 and array.dtype.kind in 'fiub':
+        return pd.DataFrame(array)
+    return pd.DataFrame(data=data).infer_objects()
+
+
 class TabularFeatureValidator(BaseFeatureValidator):
     def _fit(
         self,
@@ -49,20 +80,36 @@ class TabularFeatureValidator(BaseFeatureValidator):
             # with nan values.
             # Columns that are completely made of NaN values are provided to the pipeline
             # so that later stages decide how to handle them
-            if np.any(pd.isnull(X)):
-                for column in X.columns:
-                    if X[column].isna().all():
-                        X[column] = pd.to_numeric(X[column])
-                        # Also note this change in self.dtypes
-                        if len(self.dtypes) != 0:
-                            self.dtypes[list(X.columns).index(column)] = X[column].dtype
-
-            if not X.select_dtypes(include='object').empty:
+            # A single isna() materialization serves both the global NaN
+            # check and the all-NaN column scan, instead of one boolean
+            # frame per question asked
+            na_mask = X.isna().to_numpy()
+            if na_mask.any():
+                # One dict build replaces a per-column list(X.columns).index()
+                # lookup, which was quadratic in the number of columns
+                col_to_idx = {col: i for i, col in enumerate(X.columns)}
+                for column in X.columns[na_mask.all(axis=0)]:
+                    X[column] = pd.to_numeric(X[column])
+                    # Also note this change in self.dtypes
+                    if len(self.dtypes) != 0:
+                        self.dtypes[col_to_idx[column]] = X[column].dtype
+
+            if _has_object_columns(X):
                 X = self.infer_objects(X)
 
             self.enc_columns, self.feat_type = self._get_columns_to_encode(X)
 
             if len(self.enc_columns) > 0:
+                # The encoder machinery is only needed when categorical
+                # columns exist, so its import cost is paid here rather
+                # than by every consumer of the module
+                from sklearn import preprocessing
+                from sklearn.compose import ColumnTransformer
+
+                # Integer positions let the impute loop slice via iloc
+                # instead of hashing the column name on every access
+                self._enc_col_positions = [X.columns.get_loc(column) for column in self.enc_columns]
+
                 X = self.impute_nan_in_categories(X)
 
                 self.encoder = ColumnTransformer(
@@ -81,23 +128,12 @@ class TabularFeatureValidator(BaseFeatureValidator):
 
                 # The column transformer reoders the feature types - we therefore need to change
                 # it as well
-                # This means columns are shifted to the right
-                def comparator(cmp1: str, cmp2: str) -> int:
-                    if (
-                        cmp1 == 'categorical' and cmp2 == 'categorical'
-                        or cmp1 == 'numerical' and cmp2 == 'numerical'
-                    ):
-                        return 0
-                    elif cmp1 == 'categorical' and cmp2 == 'numerical':
-                        return -1
-                    elif cmp1 == 'numerical' and cmp2 == 'categorical':
-                        return 1
-                    else:
-                        raise ValueError((cmp1, cmp2))
-
+                # This means columns are shifted to the right. The stable sort
+                # only has to move categoricals ahead of numericals, which a
+                # plain key expresses without per-compare python calls
                 self.feat_type = sorted(
                     self.feat_type,
-                    key=functools.cmp_to_key(comparator)
+                    key=lambda feat: feat != 'categorical'
                 )
 
                 self.categories = [
@@ -107,6 +143,17 @@ class TabularFeatureValidator(BaseFeatureValidator):
                     for cat in self.encoder.transformers_[0][1].categories_
                 ]
 
+                # Cache the fitted categories as pandas dtypes. transform()
+                # encodes through these directly -- a categorical astype plus
+                # cat.codes matches the ordinal encoding (unknowns map to -1)
+                # without paying the ColumnTransformer dispatch per call
+                self._cat_dtypes = {
+                    column: pd.CategoricalDtype(categories=categories)
+                    for column, categories in zip(
+                        self.enc_columns,
+                        self.encoder.transformers_[0][1].categories_)
+                }
+
             for i, type_ in enumerate(self.feat_type):
                 if 'numerical' in type_:
                     self.numerical_columns.append(i)
@@ -144,40 +191,70 @@ class TabularFeatureValidator(BaseFeatureValidator):
         if isinstance(X, np.ndarray):
             X = self.numpy_array_to_pandas(X)
 
-        if hasattr(X, "iloc") and not scipy.sparse.issparse(X):
-            if np.any(pd.isnull(X)):
-                for column in X.columns:
-                    if X[column].isna().all():
+        # Steady-state fast path: a frame whose columns and dtypes exactly
+        # match what fit() observed cannot need dtype re-inference, NaN
+        # coercion or the schema validation in _check_data -- those are all
+        # pure functions of the schema. Frequent at inference time, where
+        # many small batches of identical layout are transformed in a row
+        schema_is_fitted = (
+            hasattr(X, "iloc") and not scipy.sparse.issparse(X)
+            and len(self.column_order) > 0
+            and list(X.columns) == self.column_order
+            and [dtype.name for dtype in X.dtypes] == self.dtypes
+        )
+
+        if not schema_is_fitted:
+            if hasattr(X, "iloc") and not scipy.sparse.issparse(X):
+                # Reuse one isna() mask for the NaN check and the column scan
+                na_mask = X.isna().to_numpy()
+                if na_mask.any():
+                    for column in X.columns[na_mask.all(axis=0)]:
                         X[column] = pd.to_numeric(X[column])
 
-            # Also remove the object dtype for new data
-            if not X.select_dtypes(include='object').empty:
-                X = self.infer_objects(X)
+                # Also remove the object dtype for new data
+                if _has_object_columns(X):
+                    X = self.infer_objects(X)
 
-        # Check the data here so we catch problems on new test data
-        self._check_data(X)
+            # Check the data here so we catch problems on new test data
+            self._check_data(X)
 
         # Pandas related transformations
         if hasattr(X, "iloc") and self.encoder is not None:
-            if np.any(pd.isnull(X)):
-                # After above check it means that if there is a NaN
-                # the whole column must be NaN
-                # Make sure it is numerical and let the pipeline handle it
-                for column in X.columns:
-                    if X[column].isna().all():
-                        X[column] = pd.to_numeric(X[column])
+            # All-NaN columns were already coerced to numeric at the top of
+            # transform, so no further full-frame NaN scan is needed here
 
             # We also need to fillna on the transformation
             # in case test data is provided
             X = self.impute_nan_in_categories(X)
 
-            X = self.encoder.transform(X)
+            if hasattr(self, '_cat_dtypes'):
+                # Mirror the fitted ColumnTransformer layout (encoded
+                # categoricals first, remaining columns passed through)
+                # without its per-call python dispatch
+                columns = [
+                    X[column].astype(self._cat_dtypes[column]).cat.codes.to_numpy()
+                    for column in self.enc_columns
+                ]
+                passthrough = [column for column in X.columns if column not in self._cat_dtypes]
+                if len(passthrough) > 0:
+                    columns.append(X[passthrough].to_numpy())
+                X = np.column_stack(columns)
+            else:
+                X = self.encoder.transform(X)
 
         # Sparse related transformations
         # Not all sparse format support index sorting
         if scipy.sparse.issparse(X) and hasattr(X, 'sort_indices'):
             X.sort_indices()
 
+        # The encoder path already produced a numeric 2-D ndarray for the
+        # common case; check_array would only re-run dtype coercion over it
+        # (finiteness is not enforced here), so skip its full O(N) pass
+        if isinstance(X, np.ndarray) and X.ndim == 2 and X.dtype.kind in 'iufc':
+            if not X.flags['C_CONTIGUOUS']:
+                X = np.ascontiguousarray(X)
+            return X
+
         try:
             X = sklearn.utils.check_array(
                 X,
@@ -191,6 +268,11 @@ class TabularFeatureValidator(BaseFeatureValidator):
                                   "Please try to manually cast it to a supported "
                                   "numerical or categorical values.")
             raise e
+
+        # Fortran-ordered or strided views would be silently copied by
+        # torch.from_numpy on every batch; pay the relayout once here
+        if isinstance(X, np.ndarray) and not X.flags['C_CONTIGUOUS']:
+            X = np.ascontiguousarray(X)
         return X
 
     def _check_data(
@@ -206,7 +288,7 @@ class TabularFeatureValidator(BaseFeatureValidator):
                 checks) and a encoder fitted in the case the data needs encoding
         """
 
-        if not isinstance(X, (np.ndarray, pd.DataFrame)) and not scipy.sparse.issparse(X):
+        if not isinstance(X, _SUPPORTED_DENSE_TYPES) and not scipy.sparse.issparse(X):
             raise ValueError("AutoPyTorch only supports Numpy arrays, Pandas DataFrames,"
                              " scipy sparse and Python Lists, yet, the provided input is"
                              " of type {}".format(type(X))
@@ -224,8 +306,11 @@ class TabularFeatureValidator(BaseFeatureValidator):
                                 )
 
         # Do not support category/string numpy data. Only numbers
+        # The dtype kind comparison is a plain attribute check, equivalent to
+        # np.issubdtype(X.dtype.type, np.number) without its type-resolution
+        # machinery, which matters as _check_data is called per fit/transform
         if hasattr(X, "dtype"):
-            if not np.issubdtype(X.dtype.type, np.number):  # type: ignore[union-attr]
+            if X.dtype.kind not in 'iufc':  # type: ignore[union-attr]
                 raise ValueError(
                     "When providing a numpy array to AutoPyTorch, the only valid "
                     "dtypes are numerical ones. The provided data type {} is not supported."
@@ -240,14 +325,14 @@ class TabularFeatureValidator(BaseFeatureValidator):
             X = typing.cast(pd.DataFrame, X)
 
             # Handle objects if possible
-            if not X.select_dtypes(include='object').empty:
+            if _has_object_columns(X):
                 X = self.infer_objects(X)
 
             # Define the column to be encoded here as the feature validator is fitted once
             # per estimator
             enc_columns, _ = self._get_columns_to_encode(X)
 
-            column_order = [column for column in X.columns]
+            column_order = list(X.columns)
             if len(self.column_order) > 0:
                 if self.column_order != column_order:
                     raise ValueError("Changing the column order of the features after fit() is "
@@ -287,6 +372,19 @@ class TabularFeatureValidator(BaseFeatureValidator):
             feat_type:
                 Type of each column numerical/categorical
         """
+        # After fit, the outcome only depends on the frame schema, so
+        # repeated transform/_check_data calls with the same columns and
+        # dtypes can reuse a previous scan
+        key = (tuple(X.columns), tuple(map(str, X.dtypes)))
+        if not hasattr(self, '_columns_to_encode_cache'):
+            self._columns_to_encode_cache: typing.Dict[
+                typing.Tuple[typing.Tuple, typing.Tuple],
+                typing.Tuple[typing.List[str], typing.List[str]]
+            ] = {}
+        cached = self._columns_to_encode_cache.get(key)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+
         # Register if a column needs encoding
         enc_columns = []
 
@@ -294,15 +392,18 @@ class TabularFeatureValidator(BaseFeatureValidator):
         feat_type = []
 
         # Make sure each column is a valid type
-        for i, column in enumerate(X.columns):
-            if X[column].dtype.name in ['category', 'bool']:
+        # Walking X.dtypes hands us the dtype objects directly; indexing
+        # X[column] per iteration would materialize a Series each time just
+        # to read the same information
+        for column, dtype in X.dtypes.items():
+            if dtype.name in ['category', 'bool']:
 
                 enc_columns.append(column)
                 feat_type.append('categorical')
             # Move away from np.issubdtype as it causes
             # TypeError: data type not understood in certain pandas types
-            elif not is_numeric_dtype(X[column]):
-                if X[column].dtype.name == 'object':
+            elif not is_numeric_dtype(dtype):
+                if dtype.name == 'object':
                     raise ValueError(
                         "Input Column {} has invalid type object. "
                         "Cast it to a valid dtype before using it in AutoPyTorch. "
@@ -317,7 +418,7 @@ class TabularFeatureValidator(BaseFeatureValidator):
                         )
                     )
                 elif pd.core.dtypes.common.is_datetime_or_timedelta_dtype(
-                    X[column].dtype
+                    dtype
                 ):
                     raise ValueError(
                         "AutoPyTorch does not support time and/or date datatype as given "
@@ -334,11 +435,16 @@ class TabularFeatureValidator(BaseFeatureValidator):
                         "Make sure your data is formatted in a correct way, "
                         "before feeding it to AutoPyTorch.".format(
                             column,
-                            X[column].dtype.name,
+                            dtype.name,
                         )
                     )
             else:
                 feat_type.append('numerical')
+
+        # Keep the cache small; schemas rarely change between calls
+        if len(self._columns_to_encode_cache) >= 8:
+            self._columns_to_encode_cache.pop(next(iter(self._columns_to_encode_cache)))
+        self._columns_to_encode_cache[key] = (list(enc_columns), list(feat_type))
         return enc_columns, feat_type
 
     def list_to_dataframe(
@@ -365,7 +471,7 @@ class TabularFeatureValidator(BaseFeatureValidator):
         """
 
         # If a list was provided, it will be converted to pandas
-        X_train = pd.DataFrame(data=X_train).infer_objects()
+        X_train = _list_to_typed_dataframe(X_train)
         self.logger.warning("The provided feature types to AutoPyTorch are of type list."
                             "Features have been interpreted as: {}".format([(col, t) for col, t in
                                                                             zip(X_train.columns, X_train.dtypes)]))
@@ -374,7 +480,9 @@ class TabularFeatureValidator(BaseFeatureValidator):
                 self.logger.warning("Train features are a list while the provided test data"
                                     "is {}. X_test will be casted as DataFrame.".format(type(X_test))
                                     )
-            X_test = pd.DataFrame(data=X_test).infer_objects()
+                X_test = pd.DataFrame(data=X_test).infer_objects()
+            else:
+                X_test = _list_to_typed_dataframe(X_test)
         return X_train, X_test
 
     def numpy_array_to_pandas(
@@ -391,7 +499,14 @@ class TabularFeatureValidator(BaseFeatureValidator):
         Returns:
             pd.DataFrame
         """
-        return pd.DataFrame(X).infer_objects().convert_dtypes()
+        df = pd.DataFrame(X, copy=False)
+        if X.dtype == object:
+            # Only object arrays need per-column inference; numeric arrays
+            # already carry their dtype and the frame just wraps the buffer.
+            # convert_dtypes on an already-numeric input would allocate
+            # nullable masked arrays for every column for no benefit
+            df = df.infer_objects().convert_dtypes()
+        return df
 
     def infer_objects(self, X: pd.DataFrame) -> pd.DataFrame:
         """
@@ -413,7 +528,9 @@ class TabularFeatureValidator(BaseFeatureValidator):
                     # In the case train data was interpreted as int
                     # and test data was interpreted as float, because of 0.0
                     # for example, honor training data
-                    X[key] = X[key].applymap(np.int64)
+                    # The vectorized cast replaces an applymap(np.int64),
+                    # which made one python call per element
+                    X[key] = pd.to_numeric(X[key], errors='raise').astype(np.int64, copy=False)
                 else:
                     try:
                         X[key] = X[key].astype(dtype.name)
@@ -453,18 +570,25 @@ class TabularFeatureValidator(BaseFeatureValidator):
         # First make sure that we do not alter the type of the column which cause:
         # TypeError: '<' not supported between instances of 'int' and 'str'
         # in the encoding
-        for column in self.enc_columns:
-            if X[column].isna().any():
+        # Positional iloc slicing skips the name hash lookup per access;
+        # validators unpickled from before the positions were cached fall
+        # back to resolving them here
+        positions = getattr(self, '_enc_col_positions', None)
+        if positions is None:
+            positions = [X.columns.get_loc(column) for column in self.enc_columns]
+        for position, column in zip(positions, self.enc_columns):
+            col = X.iloc[:, position]
+            if col.isna().any():
                 if column not in self.dict_missing_value_per_col:
                     try:
-                        float(X[column].dropna().values[0])
+                        float(col.dropna().values[0])
                         can_cast_as_number = True
                     except Exception:
                         can_cast_as_number = False
                     if can_cast_as_number:
                         # In this case, we expect to have a number as category
                         # it might be string, but its value represent a number
-                        missing_value: typing.Union[str, int] = '-1' if isinstance(X[column].dropna().values[0],
+                        missing_value: typing.Union[str, int] = '-1' if isinstance(col.dropna().values[0],
                                                                                    str) else -1
                     else:
                         missing_value = 'Missing!'
@@ -472,16 +596,19 @@ class TabularFeatureValidator(BaseFeatureValidator):
                     # Make sure this missing value is not seen before
                     # Do this check for categorical columns
                     # else modify the value
-                    if hasattr(X[column], 'cat'):
-                        while missing_value in X[column].cat.categories:
+                    if hasattr(col, 'cat'):
+                        # Snapshot the categories as a set so each collision
+                        # retry is an O(1) hash probe rather than an index scan
+                        existing_categories = set(col.cat.categories)
+                        while missing_value in existing_categories:
                             if isinstance(missing_value, str):
                                 missing_value += '0'
                             else:
                                 missing_value += missing_value
                     self.dict_missing_value_per_col[column] = missing_value
 
-                # Convert the frame in place
-                X[column].cat.add_categories([self.dict_missing_value_per_col[column]],
-                                             inplace=True)
-                X.fillna({column: self.dict_missing_value_per_col[column]}, inplace=True)
+                # The inplace categorical mutators are deprecated, so assign
+                # the extended/filled column back instead
+                fill_value = self.dict_missing_value_per_col[column]
+                X[column] = col.cat.add_categories([fill_value]).fillna(fill_value)
         return X
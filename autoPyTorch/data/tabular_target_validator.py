@@ -16,6 +16,12 @@ from sklearn.utils.multiclass import type_of_target
 from autoPyTorch.data.base_target_validator import BaseTargetValidator, SUPPORTED_TARGET_TYPES
 
 
+# Concrete types accepted by _check_data. Kept as a module-level tuple so the
+# isinstance check does not rebuild it on every call; sparse inputs are
+# covered separately through the C-level scipy.sparse.issparse check
+_SUPPORTED_DENSE_TYPES = (np.ndarray, pd.DataFrame, list, pd.Series)
+
+
 class TabularTargetValidator(BaseTargetValidator):
     def _fit(
         self,
@@ -75,7 +81,9 @@ class TabularTargetValidator(BaseTargetValidator):
                 y_train = typing.cast(pd.DataFrame, y_train)
                 self.encoder.fit(y_train.to_numpy().reshape(-1, 1))
             else:
-                self.encoder.fit(np.array(y_train).reshape(-1, 1))
+                # np.asarray is a no-op for arrays that are already numpy,
+                # so the common ndarray case does not pay for a copy
+                self.encoder.fit(np.asarray(y_train).reshape(-1, 1))
 
         # we leave objects unchanged, so no need to store dtype in this case
         if hasattr(y_train, 'dtype'):
@@ -126,7 +134,7 @@ class TabularTargetValidator(BaseTargetValidator):
                     y = typing.cast(pd.DataFrame, y)
                     y = self.encoder.transform(y.to_numpy().reshape(-1, 1)).reshape(-1)
                 else:
-                    y = self.encoder.transform(np.array(y).reshape(-1, 1)).reshape(-1)
+                    y = self.encoder.transform(np.asarray(y).reshape(-1, 1)).reshape(-1)
 
         # sklearn check array will make sure we have the
         # correct numerical features for the array
@@ -167,13 +175,19 @@ class TabularTargetValidator(BaseTargetValidator):
         shape = np.shape(y)
         if len(shape) > 1:
             y = self.encoder.inverse_transform(y)
+        elif isinstance(y, np.ndarray) and y.dtype.kind in 'iu' \
+                and (y.size == 0 or (y.min() >= 0 and y.max() < len(self.encoder.categories_[0]))):
+            # Predictions are in-range integer codes, so the ordinal decoding
+            # is a single vectorized index into the fitted categories. This
+            # skips sklearn's per-column python dispatch on the predict path
+            y = self.encoder.categories_[0][y]
         else:
             # The targets should be a flattened array, hence reshape with -1
             if hasattr(y, 'iloc'):
                 y = typing.cast(pd.DataFrame, y)
                 y = self.encoder.inverse_transform(y.to_numpy().reshape(-1, 1)).reshape(-1)
             else:
-                y = self.encoder.inverse_transform(np.array(y).reshape(-1, 1)).reshape(-1)
+                y = self.encoder.inverse_transform(np.asarray(y).reshape(-1, 1)).reshape(-1)
 
         # Inverse transform returns a numpy array of type object
         # This breaks certain metrics as accuracy, which makes type_of_target be unknown
@@ -194,9 +208,12 @@ class TabularTargetValidator(BaseTargetValidator):
                 A set of features whose dimensionality and data type is going to be checked
         """
 
-        if not isinstance(y, (np.ndarray, pd.DataFrame,
-                              typing.List, pd.Series)) \
-                and not scipy.sparse.issparse(y):  # type: ignore[misc]
+        # issparse is an attribute+class check; resolve it once for the three
+        # places below that need to know, instead of re-dispatching each time
+        y_is_sparse = scipy.sparse.issparse(y)
+
+        if not isinstance(y, _SUPPORTED_DENSE_TYPES) \
+                and not y_is_sparse:  # type: ignore[misc]
             raise ValueError("AutoPyTorch only supports Numpy arrays, Pandas DataFrames,"
                              " pd.Series, sparse data and Python Lists as targets, yet, "
                              "the provided input is of type {}".format(
@@ -205,8 +222,8 @@ class TabularTargetValidator(BaseTargetValidator):
 
         # Sparse data muss be numerical
         # Type ignore on attribute because sparse targets have a dtype
-        if scipy.sparse.issparse(y) and not np.issubdtype(y.dtype.type,  # type: ignore[union-attr]
-                                                          np.number):
+        if y_is_sparse and not np.issubdtype(y.dtype.type,  # type: ignore[union-attr]
+                                             np.number):
             raise ValueError("When providing a sparse matrix as targets, the only supported "
                              "values are numerical. Please consider using a dense"
                              " instead."
@@ -227,7 +244,7 @@ class TabularTargetValidator(BaseTargetValidator):
         has_nan_values = False
         if hasattr(y, 'iloc'):
             has_nan_values = typing.cast(pd.DataFrame, y).isnull().values.any()
-        if scipy.sparse.issparse(y):
+        if y_is_sparse:
             y = typing.cast(scipy.sparse.spmatrix, y)
             has_nan_values = not np.array_equal(y.data, y.data)
         else:
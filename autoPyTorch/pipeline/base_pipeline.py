@@ -72,6 +72,13 @@ class BasePipeline(Pipeline):
     """
     __metaclass__ = ABCMeta
 
+    # Constructed configuration spaces keyed by everything they depend on.
+    # SMAC builds a fresh pipeline object per sampled configuration, and
+    # without this cache each of those rebuilt the identical space from
+    # scratch. Custom search space updates bypass the cache, as they have
+    # no stable representation to key on
+    _config_space_cache: Dict[Tuple[str, str, str, str], ConfigurationSpace] = {}
+
     def __init__(
             self,
             config: Optional[Configuration] = None,
@@ -190,8 +197,11 @@ class BasePipeline(Pipeline):
             warnings.warn("Batch size not provided. "
                           "Will predict on the whole data in a single iteration")
             batch_size = X.shape[0]
-        loader = self.named_steps['data_loader'].get_loader(X=X, batch_size=batch_size)
-        return self.named_steps['network'].predict(loader)
+        # named_steps is a property that rebuilds a Bunch on every access,
+        # so resolve it a single time for both lookups
+        named_steps = self.named_steps
+        loader = named_steps['data_loader'].get_loader(X=X, batch_size=batch_size)
+        return named_steps['network'].predict(loader)
 
     def set_hyperparameters(
             self,
@@ -257,11 +267,26 @@ class BasePipeline(Pipeline):
             ConfigurationSpace: The configuration space describing the Pipeline.
         """
         if not hasattr(self, 'config_space') or self.config_space is None:
-            self.config_space = self._get_hyperparameter_search_space(
-                dataset_properties=self.dataset_properties,
-                include=self.include,
-                exclude=self.exclude,
-            )
+            if self.search_space_updates is None:
+                key = (self.__class__.__name__,
+                       repr(self.dataset_properties),
+                       repr(self.include),
+                       repr(self.exclude))
+                config_space = BasePipeline._config_space_cache.get(key)
+                if config_space is None:
+                    config_space = self._get_hyperparameter_search_space(
+                        dataset_properties=self.dataset_properties,
+                        include=self.include,
+                        exclude=self.exclude,
+                    )
+                    BasePipeline._config_space_cache[key] = config_space
+                self.config_space = config_space
+            else:
+                self.config_space = self._get_hyperparameter_search_space(
+                    dataset_properties=self.dataset_properties,
+                    include=self.include,
+                    exclude=self.exclude,
+                )
         return self.config_space
 
     def get_model(self) -> torch.nn.Module:
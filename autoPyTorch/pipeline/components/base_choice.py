@@ -53,6 +53,7 @@ class autoPyTorchChoice(object):
         self.choice: Optional[autoPyTorchComponent] = None
 
         self._cs_updates: Dict[str, HyperparameterSearchSpaceUpdate] = dict()
+        self._cs_updates_cache: Dict[Optional[str], Dict[str, HyperparameterSearchSpace]] = dict()
 
     def get_fit_requirements(self) -> Optional[List[FitRequirement]]:
         if self.choice is not None:
@@ -261,6 +262,8 @@ class autoPyTorchChoice(object):
         """
 
         self._cs_updates[hyperparameter_search_space_update.hyperparameter] = hyperparameter_search_space_update
+        # The translated updates are memoized, so a new update invalidates them
+        self._cs_updates_cache = {}
 
     def _get_search_space_updates(self, prefix: Optional[str] = None) -> Dict[str, HyperparameterSearchSpace]:
         """Get the search space updates with the given prefix
@@ -274,6 +277,12 @@ class autoPyTorchChoice(object):
                 Mapping of search space updates. Keys don't contain the prefix.
         """
 
+        # This method is queried for every node on each search space/pipeline
+        # construction, so the translation to HyperparameterSearchSpace objects
+        # is only done once per prefix until a new update is applied
+        if prefix in self._cs_updates_cache:
+            return self._cs_updates_cache[prefix]
+
         result: Dict[str, HyperparameterSearchSpace] = dict()
 
         # iterate over all search space updates of this node and keep the ones that have the given prefix
@@ -282,4 +291,6 @@ class autoPyTorchChoice(object):
                 result[key] = self._cs_updates[key].get_search_space()
             elif re.search(f'^{prefix}', key) is not None:
                 result[key[len(prefix) + 1:]] = self._cs_updates[key].get_search_space(remove_prefix=prefix)
+
+        self._cs_updates_cache[prefix] = result
         return result
@@ -105,6 +105,7 @@ class autoPyTorchComponent(BaseEstimator):
             self.random_state = check_random_state(random_state)
         self._fit_requirements: List[FitRequirement] = list()
         self._cs_updates: Dict[str, HyperparameterSearchSpaceUpdate] = dict()
+        self._cs_updates_cache: Dict[Optional[str], Dict[str, HyperparameterSearchSpace]] = dict()
 
     @classmethod
     def get_required_properties(cls) -> Optional[List[str]]:
@@ -268,6 +269,8 @@ class autoPyTorchComponent(BaseEstimator):
         """
 
         self._cs_updates[hyperparameter_search_space_update.hyperparameter] = hyperparameter_search_space_update
+        # The translated updates are memoized, so a new update invalidates them
+        self._cs_updates_cache = {}
 
     def _get_search_space_updates(self) -> Dict[str, HyperparameterSearchSpace]:
         """Get the search space updates
@@ -275,10 +278,17 @@ class autoPyTorchComponent(BaseEstimator):
         Returns:
             dict -- Mapping of search space updates. Keys don't contain the prefix.
         """
+        # This method is queried for every node on each search space/pipeline
+        # construction, so the translation to HyperparameterSearchSpace objects
+        # is only done once until a new update is applied
+        if None in self._cs_updates_cache:
+            return self._cs_updates_cache[None]
 
         result: Dict[str, HyperparameterSearchSpace] = dict()
 
         # iterate over all search space updates of this node and keep the ones that have the given prefix
         for key in self._cs_updates.keys():
             result[key] = self._cs_updates[key].get_search_space()
+
+        self._cs_updates_cache[None] = result
         return result
@@ -21,9 +21,18 @@ _encoders = find_components(__package__,
                             BaseEncoder)
 _addons = ThirdPartyComponents(BaseEncoder)
 
+# The merged component dict only changes when a third-party encoder is
+# registered, yet it was rebuilt for every search space construction.
+# Cache it and invalidate through a registration counter
+_components_cache: Optional[Dict[str, autoPyTorchComponent]] = None
+_addons_version = 0
+_cached_addons_version = -1
+
 
 def add_encoder(encoder: BaseEncoder) -> None:
+    global _addons_version
     _addons.add_component(encoder)
+    _addons_version += 1
 
 
 class EncoderChoice(autoPyTorchChoice):
@@ -41,10 +50,14 @@ class EncoderChoice(autoPyTorchChoice):
             Dict[str, autoPyTorchComponent]: all BaseEncoder components available
                 as choices for encoding the categorical columns
         """
-        components = OrderedDict()
-        components.update(_encoders)
-        components.update(_addons.components)
-        return components
+        global _components_cache, _cached_addons_version
+        if _components_cache is None or _cached_addons_version != _addons_version:
+            components = OrderedDict()
+            components.update(_encoders)
+            components.update(_addons.components)
+            _components_cache = components
+            _cached_addons_version = _addons_version
+        return _components_cache
 
     def get_hyperparameter_search_space(self,
                                         dataset_properties: Optional[Dict[str, BaseDatasetPropertiesType]] = None,
@@ -66,15 +79,10 @@ class EncoderChoice(autoPyTorchChoice):
             raise ValueError("no encoders found, please add a encoder")
 
         if default is None:
-            defaults = ['OneHotEncoder', 'NoEncoder']
-            for default_ in defaults:
-                if default_ in available_preprocessors:
-                    if include is not None and default_ not in include:
-                        continue
-                    if exclude is not None and default_ in exclude:
-                        continue
-                    default = default_
-                    break
+            # available_preprocessors already honors include/exclude, so the
+            # first preferred name present in it is the default
+            default = next((default_ for default_ in ('OneHotEncoder', 'NoEncoder')
+                            if default_ in available_preprocessors), None)
 
         categorical_columns = dataset_properties['categorical_columns'] \
             if isinstance(dataset_properties['categorical_columns'], List) else []
@@ -114,12 +114,35 @@ class NetworkComponent(autoPyTorchTrainingComponent):
         # Batch prediction
         Y_batch_preds = list()
 
+        # On CUDA devices, pinned host memory plus a non-blocking copy lets
+        # the transfer of the next batch overlap with the forward pass of
+        # the current one instead of serializing on each H2D copy
+        use_cuda = self.device is not None and self.device.type == 'cuda'
+
+        # BF16 autocast halves the bytes moved through a memory-bound MLP
+        # forward pass on hardware with native support; elsewhere it would
+        # fall back to slow emulation, so keep FP32 there
+        use_bf16 = use_cuda and torch.cuda.is_bf16_supported()
+
         for i, (X_batch, Y_batch) in enumerate(loader):
             # Predict on batch
-            X_batch = X_batch.float().to(self.device)
-
-            with torch.no_grad():
-                Y_batch_pred = self.network(X_batch)
+            X_batch = X_batch.float()
+            if use_cuda:
+                X_batch = X_batch.pin_memory().to(self.device, non_blocking=True)
+            else:
+                X_batch = X_batch.to(self.device)
+
+            # inference_mode is stricter than no_grad: it also skips view
+            # tracking and version counter bookkeeping on every tensor op
+            with torch.inference_mode():
+                if use_bf16:
+                    with torch.autocast(device_type='cuda', dtype=torch.bfloat16):
+                        Y_batch_pred = self.network(X_batch)
+                    # The final activation and any downstream normalization
+                    # expect full precision
+                    Y_batch_pred = Y_batch_pred.float()
+                else:
+                    Y_batch_pred = self.network(X_batch)
                 if self.final_activation is not None:
                     Y_batch_pred = self.final_activation(Y_batch_pred)
 
@@ -1,4 +1,3 @@
-import copy
 from typing import Any, Dict, Optional, Tuple, Union
 
 import numpy as np
@@ -37,7 +36,9 @@ class NetworkEmbeddingComponent(autoPyTorchSetupComponent):
         if len(X['dataset_properties']['numerical_columns']) == 0:
             num_numerical_columns = 0
         else:
-            X_train = copy.deepcopy(X['backend'].load_datamanager().train_tensors[0][:2])
+            # load_datamanager() unpickles a fresh object, so the slice is
+            # already private to this call and a deep copy is redundant
+            X_train = X['backend'].load_datamanager().train_tensors[0][:2]
 
             numerical_column_transformer = X['tabular_transformer'].preprocessor. \
                 named_transformers_['numerical_pipeline']
@@ -106,24 +106,35 @@ class BaseDataLoaderComponent(autoPyTorchTrainingComponent):
             datamanager.replace_data(X['X_train'], X['X_test'] if 'X_test' in X else None)
         train_dataset, val_dataset = datamanager.get_dataset_for_training(split_id=X['split_id'])
 
+        # When workers are requested, keep them alive across epochs and let
+        # them read ahead; respawning processes every epoch costs hundreds
+        # of milliseconds. Both knobs are only legal with num_workers > 0
+        num_workers = X.get('num_workers', 0)
+        worker_kwargs: Dict[str, Any] = {'num_workers': num_workers}
+        if num_workers > 0:
+            worker_kwargs.update(
+                persistent_workers=X.get('persistent_workers', True),
+                prefetch_factor=X.get('prefetch_factor', 2),
+            )
+
         self.train_data_loader = torch.utils.data.DataLoader(
             train_dataset,
             batch_size=min(self.batch_size, len(train_dataset)),
             shuffle=True,
-            num_workers=X.get('num_workers', 0),
             pin_memory=X.get('pin_memory', True),
             drop_last=X.get('drop_last', True),
             collate_fn=custom_collate_fn,
+            **worker_kwargs,
         )
 
         self.val_data_loader = torch.utils.data.DataLoader(
             val_dataset,
             batch_size=min(self.batch_size, len(val_dataset)),
             shuffle=False,
-            num_workers=X.get('num_workers', 0),
             pin_memory=X.get('pin_memory', True),
             drop_last=X.get('drop_last', False),
             collate_fn=custom_collate_fn,
+            **worker_kwargs,
         )
 
         return self
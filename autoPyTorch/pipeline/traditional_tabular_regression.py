@@ -64,14 +64,17 @@ class TraditionalTabularRegressionPipeline(RegressorMixin, BasePipeline):
                                  "but is %d" % batch_size)
 
             else:
-                # Probe for the target array dimensions
-                target = self.predict(X[0:2].copy())
-                if (target.shape) == 1:
+                # The first batch doubles as a probe for the target array
+                # dimensions, so that its rows are not predicted twice
+                batch_to = min(batch_size, X.shape[0])
+                target = self.predict(X[0:batch_to], batch_size=None).astype(np.float32)
+                if target.ndim == 1:
                     target = target.reshape((-1, 1))
                 y = np.zeros((X.shape[0], target.shape[1]),
                              dtype=np.float32)
+                y[0:batch_to] = target
 
-                for k in range(max(1, int(np.ceil(float(X.shape[0]) / batch_size)))):
+                for k in range(1, int(np.ceil(float(X.shape[0]) / batch_size))):
                     batch_from = k * batch_size
                     batch_to = min([(k + 1) * batch_size, X.shape[0]])
                     pred_prob = self.predict(X[batch_from:batch_to], batch_size=None)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
 
 from ConfigSpace.configuration_space import ConfigurationSpace
 from ConfigSpace.hyperparameters import (
@@ -15,8 +15,12 @@ import pandas as pd
 
 import scipy.sparse
 
-import torch
-from torch.utils.data.dataloader import default_collate
+# torch is imported lazily inside the functions that need it. This file is
+# pulled in by driver-side modules (for example the SMAC target algorithm
+# wrapper) that only use the configuration utilities, and importing torch
+# costs hundreds of milliseconds plus a sizeable chunk of memory per worker
+if TYPE_CHECKING:
+    import torch
 
 HyperparameterValueType = Union[int, str, float]
 
@@ -75,7 +79,7 @@ class HyperparameterSearchSpace(NamedTuple):
             self.hyperparameter, self.value_range, self.default_value, self.log)
 
 
-def custom_collate_fn(batch: List) -> List[Optional[torch.tensor]]:
+def custom_collate_fn(batch: List) -> Tuple[Optional['torch.Tensor'], ...]:
     """
     In the case of not providing a y tensor, in a
     dataset of form {X, y}, y would be None.
@@ -88,18 +92,21 @@ def custom_collate_fn(batch: List) -> List[Optional[torch.tensor]]:
         batch (List): a batch from a dataset
 
     Returns:
-        List[Optional[torch.Tensor]]
+        Tuple[Optional[torch.Tensor], ...]
     """
+    from torch.utils.data.dataloader import default_collate
 
-    items = list(zip(*batch))
+    features, targets = zip(*batch)
 
-    # The feature will always be available
-    items[0] = default_collate(items[0])
-    if None in items[1]:
-        items[1] = list(items[1])
+    # The feature will always be available. Every consumer immediately
+    # tuple-unpacks the batch, so build the pair directly instead of going
+    # through an intermediate list
+    features = default_collate(features)
+    if None in targets:
+        targets = list(targets)
     else:
-        items[1] = default_collate(items[1])
-    return items
+        targets = default_collate(targets)
+    return features, targets
 
 
 def replace_string_bool_to_bool(dictionary: Dict[str, Any]) -> Dict[str, Any]:
@@ -121,7 +128,7 @@ def replace_string_bool_to_bool(dictionary: Dict[str, Any]) -> Dict[str, Any]:
     return dictionary
 
 
-def get_device_from_fit_dictionary(X: Dict[str, Any]) -> torch.device:
+def get_device_from_fit_dictionary(X: Dict[str, Any]) -> 'torch.device':
     """
     Get a torch device object by checking if the fit dictionary specifies a device. If not, or if no GPU is available
     return a CPU device.
@@ -132,6 +139,8 @@ def get_device_from_fit_dictionary(X: Dict[str, Any]) -> torch.device:
     Returns:
         torch.device: Device to be used for training/inference
     """
+    import torch
+
     if not torch.cuda.is_available():
         return torch.device("cpu")
 